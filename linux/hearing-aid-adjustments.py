@@ -5,12 +5,13 @@ import struct
 import sys
 import threading
 from socket import socket as Socket
-from queue import Queue
 from threading import Thread
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger: logging.Logger = logging.getLogger(__name__)
 
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QCheckBox, QPushButton, QLineEdit, QFormLayout, QGridLayout
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
@@ -31,143 +32,195 @@ ATT_CCCD_HANDLES: Dict[str, int] = {
     'HEARING_AID': ATT_HANDLES['HEARING_AID'] + 1,
 }
 
+HANDLE_HEARING_AID: SimpleNamespace = SimpleNamespace(name='HEARING_AID')
+
+# Minimum hearing aid frame length: 4 header bytes plus 25 floats
+HEARING_AID_FRAME_LEN: int = 104
+
 PSM_ATT: int = 31
 
+class _Hex:
+    # Defers bytes.hex() until a log record is actually formatted
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes) -> None:
+        self.data: bytes = data
+
+    def __str__(self) -> str:
+        return self.data.hex()
+
+# ATT request header: opcode followed by a little-endian attribute handle
+_ATT_HEADER: struct.Struct = struct.Struct('<BH')
+
+# Request headers precomputed per handle name
+_READ_PDU: Dict[str, bytes] = {name: _ATT_HEADER.pack(OPCODE_READ_REQUEST, h) for name, h in ATT_HANDLES.items()}
+_WRITE_HDR: Dict[str, bytes] = {name: _ATT_HEADER.pack(OPCODE_WRITE_REQUEST, h) for name, h in ATT_HANDLES.items()}
+_CCCD_WRITE_HDR: Dict[str, bytes] = {name: _ATT_HEADER.pack(OPCODE_WRITE_REQUEST, h) for name, h in ATT_CCCD_HANDLES.items()}
+
+# Settings payload: 25 little-endian floats starting at offset 4
+_SETTINGS_STRUCT: struct.Struct = struct.Struct('<25f')
+
 class ATTManager:
     def __init__(self, mac_address: str) -> None:
         self.mac_address: str = mac_address
         self.sock: Optional[Socket] = None
-        self.responses: Queue = Queue()
-        self.listeners: Dict[int, List[Any]] = {}
+        # Serializes request/response pairs; ATT allows one outstanding request
+        self._request_lock: threading.Lock = threading.Lock()
+        # Guards the response slot together with its event
+        self._response_lock: threading.Lock = threading.Lock()
+        self._response_slot: Optional[bytes] = None
+        self._response_event: threading.Event = threading.Event()
+        # One listener slot per known handle
+        self._listeners: Dict[int, Optional[Callable[[bytes], None]]] = {handle: None for handle in ATT_HANDLES.values()}
         self.notification_thread: Optional[Thread] = None
         self.running: bool = False
+        self._rx_buf: bytearray = bytearray(512)
+        self._rx_view: memoryview = memoryview(self._rx_buf)
+        # Last hearing aid frame seen from the device, reused as the write template
+        self.last_hearing_aid_frame: Optional[bytes] = None
         # Avoid logging full MAC address to prevent sensitive data exposure
         mac_tail: str = ':'.join(mac_address.split(':')[-2:]) if isinstance(mac_address, str) and ':' in mac_address else '[redacted]'
-        logging.info(f"ATTManager initialized")
+        logger.info("ATTManager initialized")
 
     def connect(self) -> None:
-        logging.info("Attempting to connect to ATT socket")
+        logger.info("Attempting to connect to ATT socket")
         self.sock = Socket(socket.AF_BLUETOOTH, socket.SOCK_SEQPACKET, socket.BTPROTO_L2CAP)
         self.sock.connect((self.mac_address, PSM_ATT))
-        self.sock.settimeout(0.1)
         self.running = True
         self.notification_thread = Thread(target=self._listen_notifications)
         self.notification_thread.start()
-        logging.info("Connected to ATT socket")
+        logger.info("Connected to ATT socket")
 
     def disconnect(self) -> None:
-        logging.info("Disconnecting from ATT socket")
+        logger.info("Disconnecting from ATT socket")
         self.running = False
         if self.sock:
-            logging.info("Closing socket")
+            # Unblock the listener thread waiting in recv before closing
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            logger.info("Closing socket")
             self.sock.close()
         if self.notification_thread:
-            logging.info("Stopping notification thread")
+            logger.info("Stopping notification thread")
             self.notification_thread.join(timeout=1.0)
-        logging.info("Disconnected from ATT socket")
+        logger.info("Disconnected from ATT socket")
 
-    def register_listener(self, handle: int, listener: Any) -> None:
-        if handle not in self.listeners:
-            self.listeners[handle] = []
-        self.listeners[handle].append(listener)
-        logging.debug(f"Registered listener for handle {handle}")
+    def register_listener(self, handle: int, listener: Callable[[bytes], None]) -> None:
+        self._listeners[handle] = listener
+        logger.debug("Registered listener for handle %s", handle)
 
-    def unregister_listener(self, handle: int, listener: Any) -> None:
-        if handle in self.listeners:
-            self.listeners[handle].remove(listener)
-            logging.debug(f"Unregistered listener for handle {handle}")
+    def unregister_listener(self, handle: int, listener: Callable[[bytes], None]) -> None:
+        if self._listeners.get(handle) is listener:
+            self._listeners[handle] = None
+            logger.debug("Unregistered listener for handle %s", handle)
 
     def enable_notifications(self, handle: Any) -> None:
         self.write_cccd(handle, b'\x01\x00')
-        logging.info(f"Enabled notifications for handle {handle.name}")
+        logger.info("Enabled notifications for handle %s", handle.name)
 
     def read(self, handle: Any) -> bytes:
-        handle_value: int = ATT_HANDLES[handle.name]
-        lsb: int = handle_value & 0xFF
-        msb: int = (handle_value >> 8) & 0xFF
-        pdu: bytes = bytes([OPCODE_READ_REQUEST, lsb, msb])
-        logging.debug(f"Sending read request for handle {handle.name}: {pdu.hex()}")
-        self._write_raw(pdu)
-        response: bytes = self._read_response()
-        logging.debug(f"Read response for handle {handle.name}: {response.hex()}")
+        pdu: bytes = _READ_PDU[handle.name]
+        logger.debug("Sending read request for handle %s: %s", handle.name, _Hex(pdu))
+        with self._request_lock:
+            self._discard_response()
+            self._write_raw(pdu)
+            response: bytes = self._read_response()
+        logger.debug("Read response for handle %s: %s", handle.name, _Hex(response))
         return response
 
     def write(self, handle: Any, value: bytes) -> None:
-        handle_value: int = ATT_HANDLES[handle.name]
-        lsb: int = handle_value & 0xFF
-        msb: int = (handle_value >> 8) & 0xFF
-        pdu: bytes = bytes([OPCODE_WRITE_REQUEST, lsb, msb]) + value
-        logging.debug(f"Sending write request for handle {handle.name}: {pdu.hex()}")
-        self._write_raw(pdu)
-        try:
-            self._read_response()
-            logging.debug(f"Write response received for handle {handle.name}")
-        except:
-            logging.warning(f"No write response received for handle {handle.name}")
+        pdu: bytes = _WRITE_HDR[handle.name] + value
+        logger.debug("Sending write request for handle %s: %s", handle.name, _Hex(pdu))
+        with self._request_lock:
+            self._discard_response()
+            self._write_raw(pdu)
+            try:
+                self._read_response()
+                logger.debug("Write response received for handle %s", handle.name)
+            except TimeoutError:
+                logger.warning("No write response received for handle %s", handle.name)
 
     def write_cccd(self, handle: Any, value: bytes) -> None:
-        handle_value: int = ATT_CCCD_HANDLES[handle.name]
-        lsb: int = handle_value & 0xFF
-        msb: int = (handle_value >> 8) & 0xFF
-        pdu: bytes = bytes([OPCODE_WRITE_REQUEST, lsb, msb]) + value
-        logging.debug(f"Sending CCCD write request for handle {handle.name}: {pdu.hex()}")
-        self._write_raw(pdu)
-        try:
-            self._read_response()
-            logging.debug(f"CCCD write response received for handle {handle.name}")
-        except:
-            logging.warning(f"No CCCD write response received for handle {handle.name}")
+        pdu: bytes = _CCCD_WRITE_HDR[handle.name] + value
+        logger.debug("Sending CCCD write request for handle %s: %s", handle.name, _Hex(pdu))
+        with self._request_lock:
+            self._discard_response()
+            self._write_raw(pdu)
+            try:
+                self._read_response()
+                logger.debug("CCCD write response received for handle %s", handle.name)
+            except TimeoutError:
+                logger.warning("No CCCD write response received for handle %s", handle.name)
 
     def _write_raw(self, pdu: bytes) -> None:
         self.sock.send(pdu)
-        logging.debug(f"Sent PDU: {pdu.hex()}")
+        logger.debug("Sent PDU: %s", _Hex(pdu))
 
     def _read_pdu(self) -> Optional[bytes]:
-        try:
-            data: bytes = self.sock.recv(512)
-            logging.debug(f"Received PDU: {data.hex()}")
-            return data
-        except TimeoutError:
+        n: int = self.sock.recv_into(self._rx_buf, 512)
+        if n == 0:
+            # Peer closed or socket shut down
             return None
-        except:
-            raise
+        # Copy out, since the PDU may be kept after the buffer is reused
+        data: bytes = bytes(self._rx_view[:n])
+        logger.debug("Received PDU: %s", _Hex(data))
+        return data
+
+    def _discard_response(self) -> None:
+        # Drop a late response left over from a request that timed out
+        with self._response_lock:
+            self._response_event.clear()
+            self._response_slot = None
 
     def _read_response(self, timeout: float = 2.0) -> bytes:
-        try:
-            response: bytes = self.responses.get(timeout=timeout)[1:]  # Skip opcode
-            logging.debug(f"Response received: {response.hex()}")
-            return response
-        except:
-            logging.error("No response received within timeout")
-            raise Exception("No response received")
+        if not self._response_event.wait(timeout):
+            logger.error("No response received within timeout")
+            raise TimeoutError("No response received")
+        with self._response_lock:
+            self._response_event.clear()
+            pdu: bytes = self._response_slot
+            self._response_slot = None
+        response: bytes = pdu[1:]  # Skip opcode
+        logger.debug("Response received: %s", _Hex(response))
+        return response
 
     def _listen_notifications(self) -> None:
-        logging.info("Starting notification listener thread")
+        logger.info("Starting notification listener thread")
         while self.running:
             try:
                 pdu: Optional[bytes] = self._read_pdu()
-            except:
+            except OSError:
                 break
             if pdu is None:
-                continue
+                break
             if len(pdu) > 0 and pdu[0] == OPCODE_HANDLE_VALUE_NTF:
-                logging.debug(f"Notification PDU received: {pdu.hex()}")
+                logger.debug("Notification PDU received: %s", _Hex(pdu))
                 handle: int = pdu[1] | (pdu[2] << 8)
                 value: bytes = pdu[3:]
-                logging.debug(f"Notification for handle {handle}: {value.hex()}")
-                if handle in self.listeners:
-                    for listener in self.listeners[handle]:
-                        listener(value)
+                logger.debug("Notification for handle %s: %s", handle, _Hex(value))
+                if handle == ATT_HANDLES['HEARING_AID'] and len(value) >= HEARING_AID_FRAME_LEN:
+                    self.last_hearing_aid_frame = value
+                listener: Optional[Callable[[bytes], None]] = self._listeners.get(handle)
+                if listener is not None:
+                    listener(value)
             else:
-                self.responses.put(pdu)
-        logging.info("Notification listener thread stopped, trying to reconnect")
+                with self._response_lock:
+                    self._response_slot = pdu
+                    self._response_event.set()
+        logger.info("Notification listener thread stopped, trying to reconnect")
         if self.running:
             try:
                 self.connect()
             except Exception as e:
-                logging.error(f"Reconnection failed: {e}")
+                logger.error("Reconnection failed: %s", e)
 
 class HearingAidSettings:
+    __slots__ = ('left_eq', 'right_eq', 'left_amplification', 'right_amplification', 'left_tone', 'right_tone',
+                 'left_conversation_boost', 'right_conversation_boost', 'left_ambient_noise_reduction',
+                 'right_ambient_noise_reduction', 'net_amplification', 'balance', 'own_voice_amplification')
+
     def __init__(self, left_eq: List[float], right_eq: List[float], left_amp: float, right_amp: float, left_tone: float, right_tone: float,
                  left_conv: bool, right_conv: bool, left_anr: float, right_anr: float, net_amp: float, balance: float, own_voice: float) -> None:
         self.left_eq: List[float] = left_eq
@@ -183,53 +236,35 @@ class HearingAidSettings:
         self.net_amplification: float = net_amp
         self.balance: float = balance
         self.own_voice_amplification: float = own_voice
-        logging.debug(f"HearingAidSettings created: amp={net_amp}, balance={balance}, tone={left_tone}, anr={left_anr}, conv={left_conv}")
+        logger.debug("HearingAidSettings created: amp=%s, balance=%s, tone=%s, anr=%s, conv=%s", net_amp, balance, left_tone, left_anr, left_conv)
+
+# Recently parsed frames, so repeated identical notifications skip parsing
+_PARSE_CACHE_SIZE: int = 2
+_parse_cache: Dict[bytes, HearingAidSettings] = {}
+# Parsing runs on both the GUI thread (initial read) and the listener thread
+_parse_cache_lock: threading.Lock = threading.Lock()
 
 def parse_hearing_aid_settings(data: bytes) -> Optional[HearingAidSettings]:
-    logging.debug(f"Parsing hearing aid settings from data: {data.hex()}")
-    if len(data) < 104:
-        logging.warning("Data too short for parsing")
+    logger.debug("Parsing hearing aid settings from data: %s", _Hex(data))
+    if len(data) < HEARING_AID_FRAME_LEN:
+        logger.warning("Data too short for parsing")
         return None
-    buffer: bytes = data
-    offset: int = 0
-
-    offset += 4
-    
-    logging.info(f"Parsing hearing aid settings, starting read at offset 4, value: {buffer[offset]:02x}")
-
-    left_eq: List[float] = []
-    for i in range(8):
-        val, = struct.unpack('<f', buffer[offset:offset+4])
-        left_eq.append(val)
-        offset += 4
-
-    left_amp, = struct.unpack('<f', buffer[offset:offset+4])
-    offset += 4
-    left_tone, = struct.unpack('<f', buffer[offset:offset+4])
-    offset += 4
-    left_conv_float, = struct.unpack('<f', buffer[offset:offset+4])
+    key: bytes = bytes(data[:HEARING_AID_FRAME_LEN])
+    with _parse_cache_lock:
+        cached: Optional[HearingAidSettings] = _parse_cache.get(key)
+    if cached is not None:
+        logger.debug("Reusing parsed settings for unchanged frame")
+        return cached
+    logger.info("Parsing hearing aid settings, starting read at offset 4, value: %02x", data[4])
+
+    values: Tuple[float, ...] = _SETTINGS_STRUCT.unpack_from(data, 4)
+    left_eq: List[float] = list(values[0:8])
+    left_amp, left_tone, left_conv_float, left_anr = values[8:12]
     left_conv = left_conv_float > 0.5
-    offset += 4
-    left_anr, = struct.unpack('<f', buffer[offset:offset+4])
-    offset += 4
-
-    right_eq = []
-    for _ in range(8):
-        val, = struct.unpack('<f', buffer[offset:offset+4])
-        right_eq.append(val)
-        offset += 4
-
-    right_amp, = struct.unpack('<f', buffer[offset:offset+4])
-    offset += 4
-    right_tone, = struct.unpack('<f', buffer[offset:offset+4])
-    offset += 4
-    right_conv_float, = struct.unpack('<f', buffer[offset:offset+4])
+    right_eq: List[float] = list(values[12:20])
+    right_amp, right_tone, right_conv_float, right_anr = values[20:24]
     right_conv = right_conv_float > 0.5
-    offset += 4
-    right_anr, = struct.unpack('<f', buffer[offset:offset+4])
-    offset += 4
-
-    own_voice, = struct.unpack('<f', buffer[offset:offset+4])
+    own_voice: float = values[24]
 
     avg: float = (left_amp + right_amp) / 2
     amplification: float = max(-1, min(1, avg))
@@ -238,41 +273,48 @@ def parse_hearing_aid_settings(data: bytes) -> Optional[HearingAidSettings]:
 
     settings: HearingAidSettings = HearingAidSettings(left_eq, right_eq, left_amp, right_amp, left_tone, right_tone,
                               left_conv, right_conv, left_anr, right_anr, amplification, balance, own_voice)
-    logging.info(f"Parsed settings: amp={amplification}, balance={balance}")
+    logger.info("Parsed settings: amp=%s, balance=%s", amplification, balance)
+    with _parse_cache_lock:
+        _parse_cache[key] = settings
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.pop(next(iter(_parse_cache)), None)
     return settings
 
 def send_hearing_aid_settings(att_manager: ATTManager, settings: HearingAidSettings) -> None:
-    logging.info("Sending hearing aid settings")
-    data: bytes = att_manager.read(type('Handle', (), {'name': 'HEARING_AID'})())
-    if len(data) < 104:
-        logging.error("Read data too short for sending settings")
+    logger.info("Sending hearing aid settings")
+    data: Optional[bytes] = att_manager.last_hearing_aid_frame
+    if data is None or len(data) < HEARING_AID_FRAME_LEN:
+        logger.debug("No usable cached hearing aid frame, reading from device")
+        data = att_manager.read(HANDLE_HEARING_AID)
+    if len(data) < HEARING_AID_FRAME_LEN:
+        logger.error("Read data too short for sending settings")
         return
+    att_manager.last_hearing_aid_frame = data
     buffer: bytearray = bytearray(data)
 
     # Modify byte at index 2 to 0x64
     buffer[2] = 0x64
 
-    # Left ear
-    for i in range(8):
-        struct.pack_into('<f', buffer, 4 + i * 4, settings.left_eq[i])
-    struct.pack_into('<f', buffer, 36, settings.left_amplification)
-    struct.pack_into('<f', buffer, 40, settings.left_tone)
-    struct.pack_into('<f', buffer, 44, 1.0 if settings.left_conversation_boost else 0.0)
-    struct.pack_into('<f', buffer, 48, settings.left_ambient_noise_reduction)
-
-    # Right ear
-    for i in range(8):
-        struct.pack_into('<f', buffer, 52 + i * 4, settings.right_eq[i])
-    struct.pack_into('<f', buffer, 84, settings.right_amplification)
-    struct.pack_into('<f', buffer, 88, settings.right_tone)
-    struct.pack_into('<f', buffer, 92, 1.0 if settings.right_conversation_boost else 0.0)
-    struct.pack_into('<f', buffer, 96, settings.right_ambient_noise_reduction)
-
-    # Own voice
-    struct.pack_into('<f', buffer, 100, settings.own_voice_amplification)
-
-    att_manager.write(type('Handle', (), {'name': 'HEARING_AID'})(), buffer)
-    logging.info("Hearing aid settings sent")
+    values: Tuple[float, ...] = (
+        # Left ear
+        *settings.left_eq,
+        settings.left_amplification,
+        settings.left_tone,
+        1.0 if settings.left_conversation_boost else 0.0,
+        settings.left_ambient_noise_reduction,
+        # Right ear
+        *settings.right_eq,
+        settings.right_amplification,
+        settings.right_tone,
+        1.0 if settings.right_conversation_boost else 0.0,
+        settings.right_ambient_noise_reduction,
+        # Own voice
+        settings.own_voice_amplification,
+    )
+    _SETTINGS_STRUCT.pack_into(buffer, 4, *values)
+
+    att_manager.write(HANDLE_HEARING_AID, buffer)
+    logger.info("Hearing aid settings sent")
 
 class SignalEmitter(QObject):
     update_ui: pyqtSignal = pyqtSignal(HearingAidSettings)
@@ -287,13 +329,21 @@ class HearingAidApp(QWidget):
         self.debounce_timer: QTimer = QTimer()
         self.debounce_timer.setSingleShot(True)
         self.debounce_timer.timeout.connect(self.send_settings)
-        logging.info("HearingAidConfig initialized")
+        # Set while applying device settings to the UI, so they aren't echoed back
+        self._updating: bool = False
+        # Single worker sending only the most recent settings, in order
+        self._send_lock: threading.Lock = threading.Lock()
+        self._send_latest: Optional[HearingAidSettings] = None
+        self._send_event: threading.Event = threading.Event()
+        self._send_thread: Thread = Thread(target=self._send_loop, daemon=True)
+        self._send_thread.start()
+        logger.info("HearingAidConfig initialized")
 
         self.init_ui()
         self.connect_att()
 
     def init_ui(self) -> None:
-        logging.debug("Initializing UI")
+        logger.debug("Initializing UI")
         self.setWindowTitle("Hearing Aid Adjustments")
         layout: QVBoxLayout = QVBoxLayout()
 
@@ -327,6 +377,7 @@ class HearingAidApp(QWidget):
         self.amp_slider: QSlider = QSlider(Qt.Horizontal)
         self.amp_slider.setRange(-100, 100)
         self.amp_slider.setValue(50)
+        self.amp_slider.setTracking(False)
         layout.addWidget(QLabel("Amplification"))
         layout.addWidget(self.amp_slider)
 
@@ -334,6 +385,7 @@ class HearingAidApp(QWidget):
         self.balance_slider: QSlider = QSlider(Qt.Horizontal)
         self.balance_slider.setRange(-100, 100)
         self.balance_slider.setValue(50)
+        self.balance_slider.setTracking(False)
         layout.addWidget(QLabel("Balance"))
         layout.addWidget(self.balance_slider)
 
@@ -341,6 +393,7 @@ class HearingAidApp(QWidget):
         self.tone_slider: QSlider = QSlider(Qt.Horizontal)
         self.tone_slider.setRange(-100, 100)
         self.tone_slider.setValue(50)
+        self.tone_slider.setTracking(False)
         layout.addWidget(QLabel("Tone"))
         layout.addWidget(self.tone_slider)
 
@@ -348,6 +401,7 @@ class HearingAidApp(QWidget):
         self.anr_slider: QSlider = QSlider(Qt.Horizontal)
         self.anr_slider.setRange(0, 100)
         self.anr_slider.setValue(0)
+        self.anr_slider.setTracking(False)
         layout.addWidget(QLabel("Ambient Noise Reduction"))
         layout.addWidget(self.anr_slider)
 
@@ -359,6 +413,7 @@ class HearingAidApp(QWidget):
         self.own_voice_slider: QSlider = QSlider(Qt.Horizontal)
         self.own_voice_slider.setRange(0, 100)
         self.own_voice_slider.setValue(50)
+        self.own_voice_slider.setTracking(False)
         # layout.addWidget(QLabel("Own Voice Amplification"))
         # layout.addWidget(self.own_voice_slider) # seems to have no effect
         
@@ -368,7 +423,7 @@ class HearingAidApp(QWidget):
 
         # Connect signals
         for input_box in self.left_eq_inputs + self.right_eq_inputs:
-            input_box.textChanged.connect(self.on_value_changed)
+            input_box.editingFinished.connect(self.on_eq_edited)
         self.amp_slider.valueChanged.connect(self.on_value_changed)
         self.balance_slider.valueChanged.connect(self.on_value_changed)
         self.tone_slider.valueChanged.connect(self.on_value_changed)
@@ -378,53 +433,74 @@ class HearingAidApp(QWidget):
         self.reset_button.clicked.connect(self.reset_settings)
 
         self.setLayout(layout)
-        logging.debug("UI initialized")
+        logger.debug("UI initialized")
 
     def connect_att(self) -> None:
-        logging.info("Connecting to ATT in UI")
+        logger.info("Connecting to ATT in UI")
         try:
             self.att_manager.connect()
-            self.att_manager.enable_notifications(type('Handle', (), {'name': 'HEARING_AID'})())
+            self.att_manager.enable_notifications(HANDLE_HEARING_AID)
             self.att_manager.register_listener(ATT_HANDLES['HEARING_AID'], self.on_notification)
             # Initial read
-            data: bytes = self.att_manager.read(type('Handle', (), {'name': 'HEARING_AID'})())
+            data: bytes = self.att_manager.read(HANDLE_HEARING_AID)
+            if len(data) >= HEARING_AID_FRAME_LEN:
+                self.att_manager.last_hearing_aid_frame = data
             settings: Optional[HearingAidSettings] = parse_hearing_aid_settings(data)
             if settings:
                 self.emitter.update_ui.emit(settings)
-                logging.info("Initial settings loaded")
+                logger.info("Initial settings loaded")
         except Exception as e:
             if e.errno == 111:
-                logging.error("Connection refused. Try reconnecting your AirPods.")
+                logger.error("Connection refused. Try reconnecting your AirPods.")
                 sys.exit(1)
             else:
-                logging.error(f"Connection failed: {e}")
+                logger.error("Connection failed: %s", e)
 
     def on_notification(self, value: bytes) -> None:
-        logging.debug("Notification received")
+        logger.debug("Notification received")
         settings: Optional[HearingAidSettings] = parse_hearing_aid_settings(value)
         if settings:
             self.emitter.update_ui.emit(settings)
 
     def on_update_ui(self, settings: HearingAidSettings) -> None:
-        logging.debug("Updating UI with settings")
-        self.amp_slider.setValue(int(settings.net_amplification * 100))
-        self.balance_slider.setValue(int(settings.balance * 100))
-        self.tone_slider.setValue(int(settings.left_tone * 100))
-        self.anr_slider.setValue(int(settings.left_ambient_noise_reduction * 100))
-        self.conv_checkbox.setChecked(settings.left_conversation_boost)
-        self.own_voice_slider.setValue(int(settings.own_voice_amplification * 100))
-
-        for i, value in enumerate(settings.left_eq):
-            self.left_eq_inputs[i].setText(f"{value:.2f}")
-        for i, value in enumerate(settings.right_eq):
-            self.right_eq_inputs[i].setText(f"{value:.2f}")
+        logger.debug("Updating UI with settings")
+        self._updating = True
+        try:
+            self.amp_slider.setValue(int(settings.net_amplification * 100))
+            self.balance_slider.setValue(int(settings.balance * 100))
+            self.tone_slider.setValue(int(settings.left_tone * 100))
+            self.anr_slider.setValue(int(settings.left_ambient_noise_reduction * 100))
+            self.conv_checkbox.setChecked(settings.left_conversation_boost)
+            self.own_voice_slider.setValue(int(settings.own_voice_amplification * 100))
+
+            # Skip unchanged fields to avoid a needless repaint
+            for input_box, value in zip(self.left_eq_inputs, settings.left_eq):
+                text: str = f"{value:.2f}"
+                if input_box.text() != text:
+                    input_box.setText(text)
+            for input_box, value in zip(self.right_eq_inputs, settings.right_eq):
+                text = f"{value:.2f}"
+                if input_box.text() != text:
+                    input_box.setText(text)
+        finally:
+            self._updating = False
+
+    def on_eq_edited(self) -> None:
+        # editingFinished also fires on focus loss, so only act on real edits
+        input_box: QLineEdit = self.sender()
+        if not input_box.isModified():
+            return
+        input_box.setModified(False)
+        self.on_value_changed()
 
     def on_value_changed(self) -> None:
-        logging.debug("UI value changed, starting debounce")
+        if self._updating:
+            return
+        logger.debug("UI value changed, starting debounce")
         self.debounce_timer.start(100)
 
     def send_settings(self) -> None:
-        logging.info("Sending settings from UI")
+        logger.info("Sending settings from UI")
         amp: float = self.amp_slider.value() / 100.0
         balance: float = self.balance_slider.value() / 100.0
         tone: float = self.tone_slider.value() / 100.0
@@ -442,10 +518,26 @@ class HearingAidApp(QWidget):
             left_eq, right_eq, left_amp, right_amp, tone, tone,
             conv, conv, anr, anr, amp, balance, own_voice
         )
-        Thread(target=send_hearing_aid_settings, args=(self.att_manager, settings)).start()
+        with self._send_lock:
+            self._send_latest = settings
+            self._send_event.set()
+
+    def _send_loop(self) -> None:
+        while True:
+            self._send_event.wait()
+            with self._send_lock:
+                self._send_event.clear()
+                settings: Optional[HearingAidSettings] = self._send_latest
+                self._send_latest = None
+            if settings is None:
+                continue
+            try:
+                send_hearing_aid_settings(self.att_manager, settings)
+            except Exception as e:
+                logger.error("Sending settings failed: %s", e)
 
     def reset_settings(self):
-        logging.debug("Resetting settings to defaults")
+        logger.debug("Resetting settings to defaults")
         self.amp_slider.setValue(0)
         self.balance_slider.setValue(0)
         self.tone_slider.setValue(0)
@@ -455,21 +547,21 @@ class HearingAidApp(QWidget):
         self.on_value_changed()
 
     def closeEvent(self, event: Any) -> None:
-        logging.info("Closing app")
+        logger.info("Closing app")
         self.att_manager.disconnect()
         event.accept()
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
-        logging.error("Usage: python hearing-aid-adjustments.py <MAC_ADDRESS>")
+        logger.error("Usage: python hearing-aid-adjustments.py <MAC_ADDRESS>")
         sys.exit(1)
     mac: str = sys.argv[1]
     mac_regex: str = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
     import re
     if not re.match(mac_regex, mac):
-        logging.error("Invalid MAC address format")
+        logger.error("Invalid MAC address format")
         sys.exit(1)
-    logging.info(f"Starting app")
+    logger.info("Starting app")
     app: QApplication = QApplication(sys.argv)
     
     def quit_app(signum: int, frame: Any) -> None: